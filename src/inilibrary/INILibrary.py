@@ -1,8 +1,80 @@
 import configparser
+import copy
+import mmap
 import os
+import shutil
+import tempfile
 from typing import Sequence
 from robot.api.deco import keyword
-from robot.libraries.BuiltIn import BuiltIn
+from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
+
+# configparser.write() emits one small write per line; a large buffer
+# lets a whole INI file go out in a single write call.
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Files larger than this are memory-mapped and parsed from a single string
+# rather than read line by line.
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Deep-copying a parsed file only beats parsing it again from roughly this
+# size up, so smaller files are not cached.
+_CACHE_MIN_SIZE = 1024
+
+
+def _read_fast(parser, configfile):
+    """
+    Populates ``parser`` from ``configfile`` using a line-based scanner.
+
+    Like configparser in its default strict mode, duplicate sections, duplicate
+    keys, empty keys and malformed headers raise the matching configparser
+    errors. Unlike configparser, only the plain ``key = value`` form is
+    understood: no ``:`` delimiter (such lines raise ``ParsingError``), no multi-line values, no keys without a
+    value and no inline comments. Indented lines are read as ordinary lines
+    rather than continuations. Values are stored raw, bypassing configparser's
+    regex tokenizer and interpolation checks.
+    """
+    text = configfile.read()
+    raw_set = configparser.RawConfigParser.set
+    source = configfile.name
+    sections_seen = set()
+    options_seen = set()
+    section = None
+    # Text mode has already normalised line endings; split on '\n' only so
+    # that characters such as form feeds stay inside the line, as they do
+    # for configparser.
+    for lineno, line in enumerate(text.split('\n'), start=1):
+        line = line.strip()
+        if not line or line[0] in ';#':
+            continue
+        if line[0] == '[':
+            end = line.rfind(']')
+            if end < 2:
+                if section is None:
+                    raise configparser.MissingSectionHeaderError(source, lineno, line)
+                error = configparser.ParsingError(source)
+                error.append(lineno, repr(line))
+                raise error
+            section = line[1:end]
+            if section != parser.default_section:
+                if section in sections_seen:
+                    raise configparser.DuplicateSectionError(section, source, lineno)
+                sections_seen.add(section)
+                parser.add_section(section)
+            continue
+        if section is None:
+            raise configparser.MissingSectionHeaderError(source, lineno, line)
+        key, sep, value = line.partition('=')
+        key = parser.optionxform(key.strip())
+        # A ':' before the first '=' is configparser's other delimiter,
+        # which this reader does not support.
+        if not sep or not key or ':' in key:
+            error = configparser.ParsingError(source)
+            error.append(lineno, repr(line))
+            raise error
+        if (section, key) in options_seen:
+            raise configparser.DuplicateOptionError(section, key, source, lineno)
+        options_seen.add((section, key))
+        raw_set(parser, section, key, value.strip())
 
 class INILibrary:
     """
@@ -12,6 +84,9 @@ class INILibrary:
 
     The library uses Python's built-in configparser library.
 
+    The library has GLOBAL scope: one instance, and so one loaded INI file,
+    is shared by every test and suite that imports it with the same arguments.
+
     Example:
     | Load INI File | path/to/your/ini/file.ini |
     | Get INI Value | section | key |
@@ -19,19 +94,50 @@ class INILibrary:
 
     """
 
-    def __init__(self):
+    # Parsed files keyed on full_path, one entry per path, holding the
+    # (interpolation, fast, st_ino, st_mtime_ns, st_size) they were parsed
+    # with. Callers get a deep copy so Set/Remove keywords never touch the
+    # cached parser.
+    _cache = {}
+
+    ROBOT_LIBRARY_SCOPE = "GLOBAL"
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self, auto_save: bool = False):
+        """
+        Set ``auto_save`` to save any unsaved changes to the loaded INI file
+        automatically at the end of each suite.
+
+        Example usage:
+        | Library | INILibrary | auto_save=True |
+        """
         self.config = None
         self.inifile= None
+        self._dirty = False
+        self._builtin = BuiltIn()
+        self._log = self._builtin.log
+        self._info_enabled = True
+        if auto_save:
+            self.ROBOT_LIBRARY_LISTENER = self
+
+    def _end_suite(self, name, attrs):
+        if self.config is not None and self._dirty:
+            self.save_INI_file()
 
     @keyword("Load INI File")
-    def load_INI_file(self, file_path: str, interpolation: str = False):
+    def load_INI_file(self, file_path: str, interpolation: str = False, fast: bool = False):
         """
         Loads the INI file from the specifed path.
 
-        The ``file_path`` is relative to the current working directory.
+        The ``file_path`` is relative to the current working directory. Absolute paths are used as is.
 
         Fails If the ``file_path`` does not exist, an error message is logged and the method returns.
 
+        The Robot Framework log level is read here and kept until the next load:
+        if it is above INFO at load time, INFO messages from this and every later
+        keyword are skipped. A `Set Log Level` call therefore only takes effect
+        for this library from the next `Load INI File`.
+
         === Mandatory args ===
 
         - ``file_path`` (str): The path to the INI file relative to the current working directory.
@@ -39,27 +145,58 @@ class INILibrary:
         === Optional args ===
 
         - ``interpolation`` (str): The interpolation method. The default is ``configparser.Interpolation()``.
+        - ``fast`` (bool): Parse with a simple line-based reader instead of configparser's tokenizer.
+          Only ``key = value`` lines, ``[section]`` headers and ``;``/``#`` comment lines are supported:
+          ``key: value`` lines, multi-line values, keys without a value and inline comments are not.
 
         Example usage:
         | Load INI File | path/to/your/ini/file.ini |
+        | Load INI File | path/to/your/ini/file.ini | fast=True |
 
         """
+        full_path = os.path.join(os.getcwd(), file_path)
         try:
-            full_path = os.getcwd()+"/"+file_path
-            if not os.path.exists(full_path):
-                BuiltIn().log(
-                    f'File "{full_path}" not found. Please provide a valid file path.', "ERROR")
-                raise FileNotFoundError
-            self.config = configparser.ConfigParser(interpolation=configparser.Interpolation(
-                            )) if interpolation else configparser.ConfigParser()
-            self.config.read(full_path)
-            BuiltIn().log(f'Loaded INI file from {full_path}', "INFO")
-            self.inifile=file_path
+            configfile = open(full_path, 'r')
         except FileNotFoundError:
-            BuiltIn().log("INI file not loaded. Please load an INI file first.", "ERROR")
-            raise FileNotFoundError(f"File does not exists {full_path}")
-        except Exception as e:
-            raise Exception(e)
+            self._log(
+                f'File "{full_path}" not found. Please provide a valid file path.', "ERROR")
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise
+        # Parse into a local parser so a failed load leaves the previously
+        # loaded file, and any unsaved changes to it, untouched.
+        with configfile:
+            stat = os.fstat(configfile.fileno())
+            signature = (bool(interpolation), bool(fast),
+                         stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            cached = INILibrary._cache.get(full_path)
+            if cached is not None and cached[0] == signature:
+                config = copy.deepcopy(cached[1])
+            else:
+                config = configparser.ConfigParser(interpolation=configparser.Interpolation(
+                            )) if interpolation else configparser.ConfigParser()
+                if fast:
+                    _read_fast(config, configfile)
+                elif stat.st_size > _MMAP_THRESHOLD:
+                    with mmap.mmap(configfile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        text = mm[:].decode(configfile.encoding)
+                    # read_string does not translate newlines like text mode does.
+                    if '\r' in text:
+                        text = text.replace('\r\n', '\n').replace('\r', '\n')
+                    config.read_string(text, source=full_path)
+                else:
+                    config.read_file(configfile)
+                if stat.st_size >= _CACHE_MIN_SIZE:
+                    INILibrary._cache[full_path] = (signature, copy.deepcopy(config))
+        self.config = config
+        try:
+            self._info_enabled = self._builtin.get_variable_value(
+                '${LOG_LEVEL}', 'INFO') in ('TRACE', 'DEBUG', 'INFO')
+        except RobotNotRunningError:
+            self._info_enabled = True
+        if self._info_enabled:
+            self._log(f'Loaded INI file from {full_path}', "INFO")
+        self.inifile=file_path
+        self._dirty = False
 
     @keyword("Get INI Value")
     def get_INI_value(self, section: str, key: str):
@@ -70,7 +207,7 @@ class INILibrary:
 
         Fails if the ``section`` does not exist or if the ``key`` is not present.
 
-        Returns: The value of the ``key`` or None if the ``section`` does not exist or is not present. 
+        Returns: The value of the ``key``.
 
         === Mandatory args ===
 
@@ -82,22 +219,60 @@ class INILibrary:
         | Get INI Value | section | key |
 
         """
-        try: 
-            if self.config is None:
-                BuiltIn().log("INI file not loaded. Please load an INI file first.", "ERROR")
-                raise Exception("INI File not loaded")
-            if section not in self.config:
-                BuiltIn().log(f'section "{section}" not found in the INI file.', "ERROR")
-                raise Exception("Section not Found")
-            if key not in self.config[section]:
-                BuiltIn().log(f'key "{key}" not found in section "{section}".', "ERROR")
-                raise Exception("key/option not Found")
-            BuiltIn().log(
-                f'Value return for section {section} and key {key} is {self.config.get(section, key)}', "INFO")
-            return self.config.get(section, key)
-        except Exception as e:
-            raise Exception(e)
-            
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
+        try:
+            sect = self.config[section]
+        except KeyError:
+            self._log(f'section "{section}" not found in the INI file.', "ERROR")
+            raise configparser.NoSectionError(section) from None
+        if key not in sect:
+            self._log(f'key "{key}" not found in section "{section}".', "ERROR")
+            raise configparser.NoOptionError(key, section)
+        value = sect[key]
+        if self._info_enabled:
+            self._log(f'Value return for section {section} and key {key} is {value}', "INFO")
+        return value
+
+    @keyword("Get INI Values")
+    def get_INI_values(self, section: str, *keys: str):
+        """
+        Gets the values of several ``keys`` from one ``section`` in a single keyword call.
+
+        Fails if the ``config`` is None or INI File is not loaded.
+
+        Fails if the ``section`` does not exist or if any of the ``keys`` is not present.
+
+        Returns: A dictionary mapping each requested ``key`` to its value.
+
+        === Mandatory args ===
+
+        - ``section`` (str): The ``section`` in the INI file.
+        - ``keys`` (str): One or more ``keys`` in the INI file.
+
+        Example usage:
+        | Load INI File | path/to/your/ini/file.ini |
+        | ${dict}= | Get INI Values | section | key1 | key2 |
+
+        """
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
+        try:
+            sect = self.config[section]
+        except KeyError:
+            self._log(f'section "{section}" not found in the INI file.', "ERROR")
+            raise configparser.NoSectionError(section) from None
+        values = {}
+        for key in keys:
+            if key not in sect:
+                self._log(f'key "{key}" not found in section "{section}".', "ERROR")
+                raise configparser.NoOptionError(key, section)
+            values[key] = sect[key]
+        if self._info_enabled:
+            self._log(f'Values return for section {section} are {values}', "INFO")
+        return values
 
     @keyword('Set INI Value')
     def set_INI_value(self, section: str, key: str, value: str):
@@ -118,23 +293,60 @@ class INILibrary:
         | Save INI File | path/to/your/ini/file.ini |
 
         """
-        try:
-            if self.config is None:
-                BuiltIn().log("INI file not loaded. Please load an INI file first.", "ERROR")
-                raise Exception("INI File not loaded")
-            if section not in self.config:
-                self.config.add_section(section)
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
+        self._dirty = True
+        if section not in self.config:
+            self.config.add_section(section)
+        self.config.set(section, key, value)
+        if self._info_enabled:
+            self._log(f'Value set for section {section} and key {key} as {value}', "INFO")
+
+    @keyword('Set INI Values')
+    def set_INI_values(self, section: str, /, **values: str):
+        """
+        Sets several ``key``/``value`` pairs in the specified ``section`` in a single keyword call.
+
+        Fails if the ``config`` is None or INI File is not loaded.
+
+        === Mandatory args ===
+
+        - ``section`` (str): The section to which the following ``values`` to be added in the INI file.
+        - ``values`` (str): The ``key=value`` pairs to set in the INI file.
+
+        Example usage:
+        | Load INI File | path/to/your/ini/file.ini |
+        | Set INI Values | section | key1=value1 | key2=value2 |
+        | Set INI Values | section | &{dict} |
+        | Save INI File | path/to/your/ini/file.ini |
+
+        """
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
+        # Mark dirty first: keys set before a failing value stay in memory.
+        self._dirty = True
+        if section not in self.config:
+            self.config.add_section(section)
+        for key, value in values.items():
             self.config.set(section, key, value)
-            BuiltIn().log(f'Value set for section {section} and key {key} as {value}', "INFO")
-        except Exception as e:
-            raise Exception(e)
-            
+        if self._info_enabled:
+            self._log(f'Values set for section {section} as {values}', "INFO")
 
     @keyword("Save INI File")
     def save_INI_file(self, file_path: str=None):
         """
         Saves the INI file.
 
+        The file is written to a temporary file next to the target and then
+        moved into place, so an interrupted save never leaves a partially
+        written INI file behind. If the path is a symlink, the file it points to
+        is replaced and keeps its permissions.
+
+        Saving back to the loaded file is skipped when nothing has been changed
+        since it was loaded or last saved.
+
         Fails if the ``config`` is None or INI File is not loaded.
 
         === Mandatory args ===
@@ -144,20 +356,38 @@ class INILibrary:
         Example usage:
         | Save INI File | path/to/your/ini/file.ini |
         """
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
+        if not self._dirty and (file_path is None or file_path == self.inifile):
+            if self._info_enabled:
+                self._log(f'No changes to save to {self.inifile}', "INFO")
+            return
+        full_path = os.path.join(os.getcwd(), file_path or self.inifile)
+        # Replace the symlink target rather than the link itself.
+        real_path = os.path.realpath(full_path)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(real_path), suffix=".tmp")
         try:
-            if self.config is None:
-                BuiltIn().log("INI file not loaded. Please load an INI file first.", "ERROR")
-                raise Exception("INI File not loaded")
-            if file_path is None:
-                with open(os.getcwd()+"/"+self.inifile, 'w') as configfile:
-                    self.config.write(configfile)
-                    BuiltIn().log(f'INI file saved to {os.getcwd()+"/"+self.inifile}', "INFO")
+            with os.fdopen(fd, 'w', buffering=_WRITE_BUFFER_SIZE) as configfile:
+                self.config.write(configfile)
+                configfile.flush()
+                os.fsync(configfile.fileno())
+            if os.path.exists(real_path):
+                shutil.copymode(real_path, tmp_path)
             else:
-                with open(os.getcwd()+"/"+file_path, 'w') as configfile:
-                    self.config.write(configfile)
-                    BuiltIn().log(f'INI file saved to {os.getcwd()+"/"+file_path}', "INFO")
-        except Exception as e:
-            raise Exception(e)
+                # mkstemp creates the file as 0600; give a new file the mode
+                # open() would have given it.
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_path, 0o666 & ~umask)
+            os.replace(tmp_path, real_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        if file_path is None or file_path == self.inifile:
+            self._dirty = False
+        if self._info_enabled:
+            self._log(f'INI file saved to {full_path}', "INFO")
 
     @keyword("Remove Section")
     def remove_section(self, section: str):
@@ -177,18 +407,16 @@ class INILibrary:
         | Remove Section | section |
         | Save INI File | path/to/your/ini/file.ini |
         """
-        try:
-            if self.config is None:
-                BuiltIn().log("INI file not loaded. Please load an INI file first.", "ERROR")
-                raise Exception("INI File not loaded")
-            if section not in self.config:
-                BuiltIn().log(f'Section "{section}" not found in the INI file.', "ERROR")
-                raise Exception('Section not found')
-            self.config.remove_section(section)
-            BuiltIn().log(f'Removed section "{section}"', "INFO")
-        except Exception as e:
-            raise Exception(e)
-            
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
+        if section not in self.config:
+            self._log(f'Section "{section}" not found in the INI file.', "ERROR")
+            raise configparser.NoSectionError(section)
+        self.config.remove_section(section)
+        self._dirty = True
+        if self._info_enabled:
+            self._log(f'Removed section "{section}"', "INFO")
 
     @keyword('Remove INI Key')
     def remove_INI_key(self, section: str, key: str):
@@ -210,21 +438,21 @@ class INILibrary:
         | Save INI File | path/to/your/ini/file.ini |
 
         """
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
         try:
-            if self.config is None:
-                BuiltIn().log("INI file not loaded. Please load an INI file first.", "ERROR")
-                raise Exception("INI File not loaded")
-            if section not in self.config:
-                BuiltIn().log(f'Section "{section}" not found in the INI file.', "ERROR")
-                raise Exception('Section not found')
-            if key not in self.config[section]:
-                BuiltIn().log(f'key "{key}" not found in section "{section}".', "ERROR")
-                raise Exception("Key not found")
-            self.config.remove_option(section, key)
-            BuiltIn().log(f'Removed key "{key}" from section "{section}"', "INFO")
-        except Exception as e:
-            raise Exception(e)
-            
+            sect = self.config[section]
+        except KeyError:
+            self._log(f'Section "{section}" not found in the INI file.', "ERROR")
+            raise configparser.NoSectionError(section) from None
+        if key not in sect:
+            self._log(f'key "{key}" not found in section "{section}".', "ERROR")
+            raise configparser.NoOptionError(key, section)
+        self.config.remove_option(section, key)
+        self._dirty = True
+        if self._info_enabled:
+            self._log(f'Removed key "{key}" from section "{section}"', "INFO")
 
     @keyword("Get All Keys And Values")
     def get_all_keys_and_values(self, section: str):
@@ -233,7 +461,9 @@ class INILibrary:
 
         Fails if the ``config`` is None or INI File is not loaded.
 
-        Returns: A dictionary with the keys and values or None if the ``section`` does not exist.
+        Fails if the ``section`` does not exist.
+
+        Returns: A dictionary with the keys and values.
 
         === Mandatory Args ===
 
@@ -243,18 +473,56 @@ class INILibrary:
         | Load INI File | path/to/your/ini/file.ini |
         | ${dict}= | Get All Keys And Values | section |
         """
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
+        if section not in self.config:
+            self._log(f'Section "{section}" not found in the INI file.', "ERROR")
+            raise configparser.NoSectionError(section)
+        items = dict(self.config.items(section))
+        if self._info_enabled:
+            self._log(f'Fetched all the Keys and Values "{items}"', "INFO")
+        return items
+
+    @keyword("Iterate Section")
+    def iterate_section(self, section: str):
+        """
+        Iterates over the keys and values under the specified ``section``.
+
+        Unlike `Get All Keys And Values`, no dictionary is returned: each value is
+        read from the INI file as the iterator reaches it. The iterator can be
+        consumed only once; a second loop over it iterates nothing, so call the
+        keyword again to loop over the section again. Note that expanding it as
+        ``@{items}`` in Robot Framework builds a list of all pairs anyway.
+
+        Fails if the ``config`` is None or INI File is not loaded.
+
+        Fails if the ``section`` does not exist.
+
+        Returns: An iterator of ``(key, value)`` pairs.
+
+        === Mandatory Args ===
+
+        - ``section`` (str): The ``section`` in the INI file.
+
+        Example usage:
+        | Load INI File | path/to/your/ini/file.ini |
+        | ${items}= | Iterate Section | section |
+        | FOR | ${item} | IN | @{items} |
+        |     | Log | ${item}[0]=${item}[1] |
+        | END |
+        """
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
         try:
-            if self.config is None:
-                BuiltIn().log("INI file not loaded. Please load an INI file first.", "ERROR")
-                raise Exception("INI File not loaded")
-            if section not in self.config:
-                BuiltIn().log(f'Section "{section}" not found in the INI file.', "ERROR")
-                raise Exception('Section not found')
-            BuiltIn().log(f'Fetched all the Keys and Values "str({dict(self.config.items(section))})"', "INFO")
-            return dict(self.config.items(section))
-        except Exception as e:
-            raise Exception(e)
-            
+            sect = self.config[section]
+        except KeyError:
+            self._log(f'Section "{section}" not found in the INI file.', "ERROR")
+            raise configparser.NoSectionError(section) from None
+        if self._info_enabled:
+            self._log(f'Iterating over the Keys and Values of section "{section}"', "INFO")
+        return ((key, sect[key]) for key in sect)
 
     @keyword("Get Values List")
     def get_values_list(self, section: str, key: str):
@@ -265,9 +533,9 @@ class INILibrary:
 
         Fails if the ``section`` does not exist.
 
-        Returns: A list of values or an empty list if the ``section`` or ``key`` does not exist.
+        Fails if the ``section`` has no keys.
 
-        Returns: An empty list if the length of ``section`` items is zero.
+        Returns: A list of values or an empty list if the ``key`` does not exist.
 
         === Mandatory Args ===
 
@@ -280,27 +548,27 @@ class INILibrary:
 
         """
         values = []
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
         try:
-            if self.config is None:
-                BuiltIn().log("INI file not loaded. Please load an INI file first.", "ERROR")
-                raise Exception("INI File not loaded")
-            if section not in self.config:
-                BuiltIn().log(f'section "{section}" not found in the INI file.', "ERROR")
-                raise Exception('Section not found')
-            if len(self.config.items(section)) == 0:
-                BuiltIn().log(f'section "{section}". no keys present', "ERROR")
-                raise Exception('Atleast one pair of key-value should exist')
-            for akey, value in self.config.items(section):
-                if akey == key:
-                    values.append(value)
-            if len(values)==0:
-                BuiltIn().log(f'No matching keys "{key}" under section "{section}"', "INFO")
-                return values
-            BuiltIn().log(f'Fetched all the values for key "{key}" under section "{section}" are {values}', "INFO")
+            sect = self.config[section]
+        except KeyError:
+            self._log(f'section "{section}" not found in the INI file.', "ERROR")
+            raise configparser.NoSectionError(section) from None
+        if len(sect) == 0:
+            self._log(f'section "{section}". no keys present', "ERROR")
+            raise ValueError('Atleast one pair of key-value should exist')
+        if key in sect:
+            values.append(sect[key])
+        if len(values)==0:
+            if self._info_enabled:
+                self._log(f'No matching keys "{key}" under section "{section}"', "INFO")
             return values
-        except Exception as e:
-            Exception(e)
-            
+        if self._info_enabled:
+            self._log(f'Fetched all the values for key "{key}" under section "{section}" are {values}', "INFO")
+        return values
+
     @keyword("Section Exists")
     def section_exists(self, section: str):
         """
@@ -308,7 +576,7 @@ class INILibrary:
 
         Fails if the ``config`` is None or INI File is not loaded.
 
-        Returns: True if the ``section`` exists and None if the Exception occurs, False If ``section`` does not exists.
+        Returns: True if the ``section`` exists, False otherwise.
 
         === Mandatory Args ===
 
@@ -319,16 +587,13 @@ class INILibrary:
         | ${bool}= | Section Exists | section |
 
         """
-        try:
-            if self.config is None:
-                BuiltIn().log("INI file not loaded. Please load an INI file first.", "ERROR")
-                raise Exception("INI File not loaded")
-            BuiltIn().log(
-                f'Section "{section}" exists in the INI file', "INFO")
-            return self.config.has_section(section)
-        except Exception as e:
-            raise Exception(e)
-            
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
+        exists = self.config.has_section(section)
+        if self._info_enabled:
+            self._log(f'Section "{section}" exists in the INI file is {exists}', "INFO")
+        return exists
 
     @keyword("Key Exists")
     def key_exists(self, section: str, key: str):
@@ -350,15 +615,15 @@ class INILibrary:
         | ${bool}= | Key Exists | section | key |
 
         """
+        if self.config is None:
+            self._log("INI file not loaded. Please load an INI file first.", "ERROR")
+            raise RuntimeError("INI File not loaded")
         try:
-            if self.config is None:
-                BuiltIn().log("INI file not loaded. Please load an INI file first.", "ERROR")
-                raise Exception("INI File not loaded")
-            if section not in self.config:
-                BuiltIn().log(f'section "{section}" not found in the INI file.', "ERROR")
-                raise Exception('Section not found')
-            BuiltIn().log(f'key "{key}" exists in section "{section}" is {self.config.has_option(section, key)}', "INFO")
-            return self.config.has_option(section, key)
-        except Exception as e:
-            raise Exception(e)
-           
+            sect = self.config[section]
+        except KeyError:
+            self._log(f'section "{section}" not found in the INI file.', "ERROR")
+            raise configparser.NoSectionError(section) from None
+        exists = key in sect
+        if self._info_enabled:
+            self._log(f'key "{key}" exists in section "{section}" is {exists}', "INFO")
+        return exists